@@ -0,0 +1,39 @@
+"""
+Shared asyncio runtime.
+One background event loop per process, reused by every page instead of
+creating and tearing down a loop with asyncio.run on each call.
+"""
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine
+
+_loop = None
+_loop_lock = threading.Lock()
+
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Return the process-wide background loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            try:
+                import uvloop  # Optional: faster libuv-based loop where available
+                _loop = uvloop.new_event_loop()
+            except ImportError:
+                _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="asyncio-runtime", daemon=True).start()
+    return _loop
+
+
+def submit(coro: Coroutine) -> Future:
+    """Schedule a coroutine on the background loop and return its future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run(coro: Coroutine) -> Any:
+    """
+    Run a coroutine on the background loop and block until it finishes.
+    The coroutine runs off the calling thread, so it must not touch st.session_state.
+    """
+    return submit(coro).result()
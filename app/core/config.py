@@ -1,4 +1,5 @@
 import os
+from bisect import bisect_left
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
@@ -23,6 +24,13 @@ DIFFICULTY_LABELS = {
     10: "FAANG (Elite)"
 }
 
+# Highest level in each difficulty tier: 1-3, 4-6, 7-8, 9-10
+DIFFICULTY_TIER_MAX = (3, 6, 8, 10)
+
+def difficulty_tier(level: int) -> int:
+    """Return the tier (0-3) a difficulty level falls in."""
+    return min(bisect_left(DIFFICULTY_TIER_MAX, level), len(DIFFICULTY_TIER_MAX) - 1)
+
 @dataclass(frozen=True)
 class Config:
     # API Keys
@@ -54,19 +62,20 @@ class Config:
 def get_technical_persona(difficulty: int, cv_summary: str = "") -> str:
     """Generate dynamic technical persona based on difficulty level and optional CV."""
     
-    if difficulty <= 3:
+    tier = difficulty_tier(difficulty)
+    if tier == 0:
         company_type = "small startup"
         question_style = "basic coding questions and simple problem-solving"
         tone = "friendly and encouraging"
         complexity = "simple data structures like arrays and strings"
         followup_depth = "light"
-    elif difficulty <= 6:
+    elif tier == 1:
         company_type = "mid-size tech company"
         question_style = "moderate algorithmic problems and basic system design"
         tone = "professional but approachable"
         complexity = "common algorithms, basic system design, and trade-off discussions"
         followup_depth = "moderate"
-    elif difficulty <= 8:
+    elif tier == 2:
         company_type = "top tech company"
         question_style = "challenging algorithms and detailed system design"
         tone = "rigorous but fair"
@@ -138,19 +147,20 @@ Follow-up depth: {followup_depth}.
 def get_hr_persona(difficulty: int, cv_summary: str = "") -> str:
     """Generate dynamic HR persona based on difficulty level and optional CV."""
     
-    if difficulty <= 3:
+    tier = difficulty_tier(difficulty)
+    if tier == 0:
         company_type = "startup"
         focus = "basic communication and cultural fit"
         expectations = "general responses about teamwork and motivation"
         tone = "casual and friendly"
         probing_style = "gentle"
-    elif difficulty <= 6:
+    elif tier == 1:
         company_type = "established company"
         focus = "structured behavioral answers using STAR method"
         expectations = "specific examples with clear outcomes"
         tone = "professional and balanced"
         probing_style = "moderate"
-    elif difficulty <= 8:
+    elif tier == 2:
         company_type = "competitive tech company"
         focus = "leadership, conflict resolution, and impact measurement"
         expectations = "quantified results and demonstrated growth"
@@ -4,8 +4,15 @@ Orchestrates the interview flow: starting sessions, processing audio, ending rev
 Contains NO UI code. Supports Technical and HR interview modes with difficulty levels and speech analytics.
 """
 import asyncio
+import os
+import tempfile
+from collections import deque
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional
+import aiofiles
 import streamlit as st
-from app.core.config import InterviewMode, DIFFICULTY_LABELS
+from app.core import asyncio_runtime
+from app.core.config import InterviewMode, DIFFICULTY_LABELS, difficulty_tier
 from app.core.logger import logger
 from app.db.session import SessionLocal
 from app.repositories.interview_repo import InterviewRepository
@@ -22,6 +29,14 @@ _tts_service = None
 _storage_service = None
 _speech_analytics = None
 
+# Greeting company type per difficulty tier, and a lookup indexed by level (0-10)
+_COMPANY_TIERS = ("a growing startup", "an established tech company", "a top tech company", "a FAANG company")
+_COMPANY_TYPES = tuple(_COMPANY_TIERS[difficulty_tier(d)] for d in range(11))
+
+# TTS scratch files kept on disk per session; older ones are deleted because
+# their audio is already in memory and the replay copy lives in stored_interviews
+_TEMP_AUDIO_KEEP = 4
+
 def get_services():
     """Lazy initialization of services."""
     global _groq_service, _review_service, _tts_service, _storage_service, _speech_analytics
@@ -56,14 +71,7 @@ def start_new_interview(mode: str = InterviewMode.TECHNICAL, difficulty: int = 5
         st.session_state.turn_analytics = []
         
         # Generate difficulty-aware greeting
-        if difficulty <= 3:
-            company_type = "a growing startup"
-        elif difficulty <= 6:
-            company_type = "an established tech company"
-        elif difficulty <= 8:
-            company_type = "a top tech company"
-        else:
-            company_type = "a FAANG company"
+        company_type = _COMPANY_TYPES[difficulty]
         
         # Check for RAG context to personalize the greeting
         rag_context = ""
@@ -120,38 +128,50 @@ def start_new_interview(mode: str = InterviewMode.TECHNICAL, difficulty: int = 5
         st.session_state.recorder_key += 1
         
         # Generate initial voice
-        asyncio.run(tts.text_to_speech(initial_msg, f"welcome_{session.id}"))
+        welcome_path = asyncio_runtime.run(tts.text_to_speech(initial_msg, f"welcome_{session.id}"))
+        st.session_state.last_ai_audio = Path(welcome_path).read_bytes() if welcome_path else None
+        _track_temp_audio(welcome_path)
         logger.info(f"Started new {mode} interview (difficulty {difficulty}, RAG={rag_active}) session: {session.id}")
     finally:
         db.close()
 
-async def process_audio_turn(audio_bytes: bytes):
-    """
-    Process a single interview turn with speech analytics.
-    Uses current mode and difficulty from session state.
-    """
-    if not audio_bytes or len(audio_bytes) < 1000:
-        logger.warning("Audio too short, skipping processing.")
-        return False
+def _track_temp_audio(path: Optional[str]):
+    """Remember a TTS scratch file, deleting the oldest once the session keeps too many."""
+    if not path:
+        return
+    paths = st.session_state.get("audio_paths")
+    if paths is None:
+        paths = st.session_state.audio_paths = deque(maxlen=_TEMP_AUDIO_KEEP)
+    if len(paths) == paths.maxlen:
+        Path(paths[0]).unlink(missing_ok=True)
+    paths.append(path)
 
-    groq, review, tts, storage, analytics = get_services()
-    
-    st.session_state.turn_number += 1
-    turn_num = st.session_state.turn_number
-    session_id = st.session_state.session_id
-    mode = st.session_state.get("interview_mode", InterviewMode.TECHNICAL)
-    difficulty = st.session_state.get("difficulty_level", 5)
-    cv_content = st.session_state.get("cv_content", "")
+def _clear_temp_audio():
+    """Delete every TTS scratch file tracked for this session."""
+    paths = st.session_state.get("audio_paths")
+    while paths:
+        Path(paths.popleft()).unlink(missing_ok=True)
 
-    # 1. Save and Repair User Audio
-    storage.save_user_audio(audio_bytes, session_id, turn_num)
-    
-    # Estimate audio duration (rough: ~16KB per second for webm)
-    estimated_duration = len(audio_bytes) / 16000
-    
-    # 2. Get AI Thinking (STT + LLM) with mode, difficulty, and optional CV
-    # First, check if RAG has relevant context
-    company_context = ""
+# Short acknowledgement played while a turn is processed; identical for every
+# session, so it is synthesized once per process and kept in memory
+FILLER_TEXT = "Okay, give me a moment to think about that."
+_filler_audio: Optional[bytes] = None
+_filler_lock = asyncio.Lock()
+
+async def synthesize_filler() -> Optional[bytes]:
+    """Return the filler acknowledgement audio, synthesizing it on first use."""
+    global _filler_audio
+    async with _filler_lock:
+        if _filler_audio is None:
+            _, _, tts, _, _ = get_services()
+            filler_path = await tts.text_to_speech(FILLER_TEXT, "filler")
+            if filler_path:
+                async with aiofiles.open(filler_path, "rb") as f:
+                    _filler_audio = await f.read()
+    return _filler_audio
+
+def _get_company_context(query: str) -> str:
+    """Look up RAG company context for a turn; returns "" if none is available."""
     try:
         from app.services.rag_service import RAGService
         rag_service = RAGService()
@@ -159,58 +179,195 @@ async def process_audio_turn(audio_bytes: bytes):
             # Query for context based on the current conversation topic
             # We use the candidate's last message or current transcription as query
             # For the first turn, we use the initial AI message topic
-            last_ai_msg = st.session_state.get("last_ai_message", "")
-            company_context = rag_service.get_context_for_prompt(last_ai_msg)
+            return rag_service.get_context_for_prompt(query)
     except Exception as e:
         logger.error(f"RAG Context Error: {e}")
+    return ""
+
+def begin_audio_turn() -> Dict:
+    """
+    Snapshot the session state needed to process the next turn.
+    process_audio_turn works only from this snapshot, so it can run off the
+    Streamlit script thread where st.session_state is not available.
+    """
+    return {
+        "turn_num": st.session_state.turn_number + 1,
+        "session_id": st.session_state.session_id,
+        "mode": st.session_state.get("interview_mode", InterviewMode.TECHNICAL),
+        "difficulty": st.session_state.get("difficulty_level", 5),
+        "cv_content": st.session_state.get("cv_content", ""),
+        "history": list(st.session_state.messages),
+        "last_ai_message": st.session_state.get("last_ai_message", ""),
+    }
+
+async def spool_audio(audio_bytes: bytes) -> str:
+    """Write a recording to a temporary file and return its path."""
+    fd, path = tempfile.mkstemp(suffix=".webm")
+    os.close(fd)
+    async with aiofiles.open(path, "wb") as f:
+        await f.write(audio_bytes)
+    return path
 
-    result = await groq.get_response_from_audio(
-        audio_bytes,
-        mode=mode,
-        difficulty=difficulty,
-        history=st.session_state.messages,
-        cv_summary=cv_content,
-        company_context=company_context
+async def process_audio_turn(
+    audio_path: str,
+    turn: Dict,
+    on_update: Optional[Callable[[str, str], Awaitable[None]]] = None
+) -> Optional[Dict]:
+    """
+    Process a single interview turn with speech analytics.
+    audio_path is a spooled recording (see spool_audio) and is removed afterwards.
+    Uses the mode, difficulty and history captured by begin_audio_turn.
+    on_update is awaited with (stage, text) as the turn progresses: "transcribed"
+    with the candidate text, "token" with the partial AI reply, and "voice" once
+    speech synthesis starts. Returns None if the audio is too short.
+    """
+    try:
+        return await _process_audio_file(audio_path, turn, on_update)
+    finally:
+        try:
+            os.unlink(audio_path)
+        except OSError:
+            pass
+
+async def _process_audio_file(
+    audio_path: str,
+    turn: Dict,
+    on_update: Optional[Callable[[str, str], Awaitable[None]]]
+) -> Optional[Dict]:
+    """Body of process_audio_turn; the caller owns cleanup of audio_path."""
+    audio_size = os.path.getsize(audio_path)
+    if audio_size < 1000:
+        logger.warning("Audio too short, skipping processing.")
+        return None
+
+    groq, review, tts, storage, analytics = get_services()
+    
+    turn_num = turn["turn_num"]
+    session_id = turn["session_id"]
+
+    async def notify(stage: str, text: str = ""):
+        if on_update is not None:
+            await on_update(stage, text)
+
+    async def on_transcript(text: str):
+        await notify("transcribed", text)
+
+    async def on_token(text: str):
+        await notify("token", text)
+
+    # 1. Save and Repair User Audio
+    # Runs in a thread alongside STT: both only read the spooled file, so
+    # transcription starts right away instead of waiting for ffmpeg
+    save_user_audio = asyncio.create_task(
+        asyncio.to_thread(storage.save_user_audio_file, audio_path, session_id, turn_num)
     )
+    
+    # Estimate audio duration (rough: ~16KB per second for webm)
+    estimated_duration = audio_size / 16000
+    
+    try:
+        # 2. Get AI Thinking (STT + LLM) with mode, difficulty, and optional CV
+        # The RAG lookup only feeds the LLM prompt, so it runs during transcription
+        company_context = asyncio.create_task(
+            asyncio.to_thread(_get_company_context, turn["last_ai_message"])
+        )
 
+        result = await groq.get_response_from_audio(
+            audio_path,
+            mode=turn["mode"],
+            difficulty=turn["difficulty"],
+            history=turn["history"],
+            cv_summary=turn["cv_content"],
+            company_context=company_context,
+            on_transcript=on_transcript,
+            on_token=on_token
+        )
+    finally:
+        # The spooled file is deleted once this turn returns
+        await save_user_audio
     
     candidate_text = result['candidate_transcription']
     ai_reply = result['interviewer_response']
     
-    # 3. Analyze speech
-    turn_analytics = analytics.analyze_transcript(candidate_text, estimated_duration)
-    st.session_state.turn_analytics.append(turn_analytics)
-
-    # 4. Generate and Store AI Voice
-    temp_tts_path = await tts.text_to_speech(ai_reply, f"session_{session_id}_turn_{turn_num}_ai_temp")
+    # 3. Analyze speech and 4. Generate AI Voice concurrently
+    await notify("voice")
+    turn_analytics, temp_tts_path = await asyncio.gather(
+        asyncio.to_thread(analytics.analyze_transcript, candidate_text, estimated_duration),
+        tts.text_to_speech(ai_reply, f"session_{session_id}_turn_{turn_num}_ai_temp"),
+    )
+    ai_audio = None
     if temp_tts_path:
         storage.save_ai_audio(temp_tts_path, session_id, turn_num)
+        # Hand the bytes to the UI so reruns play from memory, not disk
+        async with aiofiles.open(temp_tts_path, "rb") as f:
+            ai_audio = await f.read()
+
+    return {
+        "candidate_text": candidate_text,
+        "ai_reply": ai_reply,
+        "analytics": turn_analytics,
+        "ai_audio": ai_audio,
+        "tts_path": temp_tts_path,
+    }
 
-    # 5. Update State
-    st.session_state.messages.append({"role": "user", "content": candidate_text})
-    st.session_state.messages.append({"role": "assistant", "content": ai_reply})
-    st.session_state.last_ai_message = ai_reply
+def complete_audio_turn(turn: Dict, result: Dict):
+    """Apply a processed turn to session state. Must run on the script thread."""
+    st.session_state.turn_number = turn["turn_num"]
+    st.session_state.turn_analytics.append(result["analytics"])
+    st.session_state.messages.append({"role": "user", "content": result["candidate_text"]})
+    st.session_state.messages.append({"role": "assistant", "content": result["ai_reply"]})
+    st.session_state.last_ai_message = result["ai_reply"]
+    st.session_state.last_ai_audio = result["ai_audio"]
     st.session_state.recorder_key += 1
+    _track_temp_audio(result["tts_path"])
     
-    logger.info(f"Processed turn {turn_num} for session {session_id} (mode={mode}, difficulty={difficulty})")
-    return True
+    logger.info(f"Processed turn {turn['turn_num']} for session {turn['session_id']} (mode={turn['mode']}, difficulty={turn['difficulty']})")
 
-async def end_interview_and_review():
+def collect_pending_turn(wait: bool = False) -> Optional[Dict]:
+    """
+    Apply the turn in st.session_state.pending_turn once its future is done.
+    Returns the turn result, or None if nothing was applied.
+    """
+    pending = st.session_state.get("pending_turn")
+    if pending is None:
+        return None
+    turn, future = pending["turn"], pending["future"]
+    if not wait and not future.done():
+        return None
+    st.session_state.pending_turn = None
+    try:
+        result = future.result()
+    except Exception as e:
+        logger.error(f"Error processing turn {turn['turn_num']} for session {turn['session_id']}: {e}")
+        return None
+    if not result:
+        return None
+    if turn["session_id"] != st.session_state.session_id:
+        # The interview was replaced while this turn ran; just drop its scratch audio
+        if result["tts_path"]:
+            Path(result["tts_path"]).unlink(missing_ok=True)
+        return None
+    complete_audio_turn(turn, result)
+    return result
+
+def end_interview_and_review():
     """
     End the interview, generate a performance review with analytics, and save to DB.
     """
+    # Include an answer still being processed when the user ended the interview
+    collect_pending_turn(wait=True)
     groq, review, tts, storage, analytics = get_services()
     
     # Aggregate speech analytics
     session_analytics = analytics.aggregate_session_analytics(st.session_state.turn_analytics)
     
     transcript_text = "\n".join([f"{m['role']}: {m['content']}" for m in st.session_state.messages])
-    review_data = await review.analyze_interview(
+    review_data = asyncio_runtime.run(review.analyze_interview(
         transcript_text,
         mode=st.session_state.get("interview_mode", InterviewMode.TECHNICAL),
         difficulty=st.session_state.get("difficulty_level", 5),
         speech_analytics=session_analytics
-    )
+    ))
     
     # Add analytics and difficulty to review data
     review_data["speech_analytics"] = session_analytics
@@ -229,6 +386,7 @@ async def end_interview_and_review():
     
     st.session_state.review_data = review_data
     st.session_state.interview_active = False
+    _clear_temp_audio()
     logger.info(f"Ended interview session: {st.session_state.session_id}")
     return review_data
 
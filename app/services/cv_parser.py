@@ -2,24 +2,38 @@
 CV Parser Service - Extracts text from uploaded PDF resumes.
 """
 import io
-from PyPDF2 import PdfReader
+from typing import BinaryIO, Iterator, Union
+import pymupdf
 from app.core.logger import logger
 
+# Limit to ~3000 characters to avoid overwhelming the LLM context
+MAX_CV_CHARS = 3000
 
-def parse_cv(file_bytes: bytes) -> str:
+
+def _iter_page_text(pdf_stream: BinaryIO) -> Iterator[str]:
+    """Yield the text of each page with PyMuPDF."""
+    with pymupdf.open(stream=pdf_stream, filetype="pdf") as doc:
+        for page in doc:
+            yield page.get_text()
+
+
+def parse_cv(pdf_source: Union[bytes, BinaryIO]) -> str:
     """
     Extract text content from a PDF file.
+    Accepts raw bytes or a binary stream (e.g. Streamlit's UploadedFile).
     Returns the extracted text or an error message.
     """
     try:
-        pdf_file = io.BytesIO(file_bytes)
-        reader = PdfReader(pdf_file)
+        pdf_stream = io.BytesIO(pdf_source) if isinstance(pdf_source, (bytes, bytearray)) else pdf_source
         
         text_content = []
-        for page in reader.pages:
-            page_text = page.extract_text()
+        extracted_chars = 0
+        for page_text in _iter_page_text(pdf_stream):
             if page_text:
                 text_content.append(page_text)
+                extracted_chars += len(page_text)
+                if extracted_chars > MAX_CV_CHARS:
+                    break  # Remaining pages would be truncated anyway
         
         full_text = "\n".join(text_content)
         
@@ -27,9 +41,8 @@ def parse_cv(file_bytes: bytes) -> str:
             logger.warning("CV parsing resulted in empty text.")
             return ""
         
-        # Limit to ~3000 characters to avoid overwhelming the LLM context
-        if len(full_text) > 3000:
-            full_text = full_text[:3000] + "..."
+        if len(full_text) > MAX_CV_CHARS:
+            full_text = full_text[:MAX_CV_CHARS] + "..."
         
         logger.info(f"Successfully parsed CV: {len(full_text)} characters extracted.")
         return full_text.strip()
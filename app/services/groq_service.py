@@ -2,15 +2,19 @@
 Groq Service - AI Brain (STT + LLM).
 Handles transcription and response generation with difficulty-adjusted personas.
 """
-from groq import Groq
-from typing import List, Dict
+import inspect
+from pathlib import Path
+from groq import AsyncGroq
+from typing import Awaitable, Callable, List, Dict, Optional, Union
 from app.core.config import settings, get_technical_persona, get_hr_persona, InterviewMode
 from app.core.logger import logger
 
 class GroqService:
     def __init__(self):
         self.api_key = settings.GROQ_API_KEY
-        self.client = Groq(api_key=self.api_key)
+        # Async client: its connection pool is reused for as long as the
+        # event loop that first used it stays alive (see app.core.asyncio_runtime)
+        self.client = AsyncGroq(api_key=self.api_key)
         self.model_id = settings.LLM_MODEL
         self.stt_model = settings.STT_MODEL
     
@@ -22,30 +26,43 @@ class GroqService:
 
     async def get_response_from_audio(
         self, 
-        audio_bytes, 
+        audio_file: Union[bytes, str], 
         mode: str = InterviewMode.TECHNICAL,
         difficulty: int = 5,
         history: List[Dict] = [],
         cv_summary: str = "",
-        company_context: str = ""
+        company_context: Union[str, Awaitable[str]] = "",
+        on_transcript: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None
     ):
         """
-        Transcribes audio using Whisper and generates an AI response.
+        Transcribes audio (bytes or a file path) using Whisper and generates an AI response.
         Uses mode, difficulty-specific persona, optional CV, and RAG company context.
+        company_context may be an awaitable, resolved only after transcription so
+        the lookup can overlap with the STT request.
+        on_transcript is awaited with the transcription before the LLM call.
+        If on_token is given, the reply is streamed and the callback is awaited
+        with the accumulated text after every chunk.
         """
 
         try:
             # 1. Transcription using Whisper on Groq
-            transcription = self.client.audio.transcriptions.create(
-                file=("input.webm", audio_bytes),
+            # audio_file may be raw bytes or a path to a spooled recording
+            audio_payload = Path(audio_file) if isinstance(audio_file, str) else audio_file
+            transcription = await self.client.audio.transcriptions.create(
+                file=("input.webm", audio_payload),
                 model=self.stt_model,
                 response_format="text"
             )
             
             candidate_text = transcription
+            if on_transcript is not None:
+                await on_transcript(candidate_text)
             
             # 2. Generate LLM Response with persona and contexts
             persona = self.get_persona(mode, difficulty, cv_summary)
+            if inspect.isawaitable(company_context):
+                company_context = await company_context
             
             # Inject company context if available
             if company_context:
@@ -61,14 +78,29 @@ class GroqService:
             
             messages.append({"role": "user", "content": candidate_text})
             
-            completion = self.client.chat.completions.create(
-                model=self.model_id,
-                messages=messages,
-                max_tokens=200,
-                temperature=0.85
-            )
-            
-            ai_response = completion.choices[0].message.content
+            if on_token is None:
+                completion = await self.client.chat.completions.create(
+                    model=self.model_id,
+                    messages=messages,
+                    max_tokens=200,
+                    temperature=0.85
+                )
+                ai_response = completion.choices[0].message.content
+            else:
+                # Stream tokens so the UI can show the reply as it is generated
+                stream = await self.client.chat.completions.create(
+                    model=self.model_id,
+                    messages=messages,
+                    max_tokens=200,
+                    temperature=0.85,
+                    stream=True
+                )
+                ai_response = ""
+                async for chunk in stream:
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        ai_response += delta
+                        await on_token(ai_response)
             
             return {
                 "candidate_transcription": candidate_text,
@@ -102,7 +134,7 @@ class GroqService:
             
             messages.append({"role": "user", "content": user_input})
             
-            completion = self.client.chat.completions.create(
+            completion = await self.client.chat.completions.create(
                 model=self.model_id,
                 messages=messages,
                 max_tokens=200,
@@ -8,10 +8,25 @@ import random
 import hashlib
 from datetime import datetime
 from typing import Dict, List, Optional
-from groq import Groq
-from app.core.config import settings
+import numpy as np
+from groq import AsyncGroq
+from app.core.config import settings, difficulty_tier
 from app.core.logger import logger
 
+# Answer letters every generated question must offer
+_OPTION_KEYS = ("A", "B", "C", "D")
+
+# Text fields every generated question must fill in
+_TEXT_FIELDS = ("question", "category", "explanation")
+
+
+class IncompleteQuestionSet(Exception):
+    """Raised by generate_questions(strict=True) when the full set couldn't be generated."""
+
+    def __init__(self, questions: List[Dict]):
+        super().__init__(f"only {len(questions)} usable questions were generated")
+        self.questions = questions  # The short or built-in fallback set
+
 
 class MindExerciseService:
     """Service for generating and managing mind exercises."""
@@ -52,7 +67,7 @@ class MindExerciseService:
     
     def __init__(self):
         self.api_key = settings.GROQ_API_KEY
-        self.client = Groq(api_key=self.api_key)
+        self.client = AsyncGroq(api_key=self.api_key)
         self.model_id = settings.LLM_MODEL
     
     def _generate_session_seed(self, user_id: str = None) -> str:
@@ -67,16 +82,20 @@ class MindExerciseService:
         num_questions: int = 10,
         categories: List[str] = None,
         difficulty: int = 5,
-        user_seed: str = None
+        user_seed: str = None,
+        strict: bool = False
     ) -> List[Dict]:
         """
         Generate a set of unique mind exercise questions.
+        All questions come from one batched prompt; if some are missing or
+        malformed, a single follow-up batch tops the set up.
         
         Args:
             num_questions: Number of questions to generate
             categories: List of categories to include (None = all)
             difficulty: 1-10 difficulty scale
             user_seed: Unique seed for this user's session
+            strict: Raise IncompleteQuestionSet instead of returning a short or fallback set
         
         Returns:
             List of question dictionaries
@@ -86,15 +105,74 @@ class MindExerciseService:
         
         seed = user_seed or self._generate_session_seed()
         
-        # Difficulty descriptors
-        difficulty_desc = {
-            (1, 3): "easy, suitable for warm-up, should take 10-20 seconds",
-            (4, 6): "moderate, requires some thought, should take 20-40 seconds",
-            (7, 8): "challenging, requires careful analysis, should take 40-60 seconds",
-            (9, 10): "very difficult, requires deep thinking, may take over 60 seconds"
-        }
+        # Difficulty descriptors, one per tier
+        difficulty_desc = (
+            "easy, suitable for warm-up, should take 10-20 seconds",
+            "moderate, requires some thought, should take 20-40 seconds",
+            "challenging, requires careful analysis, should take 40-60 seconds",
+            "very difficult, requires deep thinking, may take over 60 seconds"
+        )
+        
+        diff_text = difficulty_desc[difficulty_tier(difficulty)]
+        
+        try:
+            questions = [
+                q for q in await self._request_questions(num_questions, categories, difficulty, diff_text, seed)
+                if self._is_valid_question(q)
+            ]
+        except Exception as e:
+            logger.error(f"Error generating mind exercises: {e}")
+            return self._fallback_questions(num_questions, strict)
+        
+        missing = num_questions - len(questions)
+        if missing > 0:
+            logger.warning(f"Mind exercise batch returned {len(questions)}/{num_questions} valid questions, topping up")
+            avoid = [q['question'] for q in questions]
+            try:
+                extra = await self._request_questions(missing, categories, difficulty, diff_text, f"{seed}-topup", avoid)
+                questions += [q for q in extra if self._is_valid_question(q)]
+            except Exception as e:
+                # Keep whatever valid questions the first batch produced
+                logger.error(f"Error topping up mind exercises, keeping {len(questions)}: {e}")
+        
+        questions = questions[:num_questions]
+        if not questions:
+            logger.error("Error generating mind exercises: no valid questions in the response")
+            return self._fallback_questions(num_questions, strict)
+        
+        # Renumber so ids stay unique across the two batches, and add category metadata
+        for idx, q in enumerate(questions, start=1):
+            q['id'] = idx
+            cat_key = q.get('category', 'logical')
+            cat_info = self.CATEGORIES.get(cat_key, self.CATEGORIES['logical'])
+            q['category_name'] = cat_info['name']
+            q['category_icon'] = cat_info['icon']
         
-        diff_text = next(v for k, v in difficulty_desc.items() if k[0] <= difficulty <= k[1])
+        logger.info(f"Generated {len(questions)} mind exercise questions (seed: {seed})")
+        if strict and len(questions) < num_questions:
+            raise IncompleteQuestionSet(questions)
+        return questions
+    
+    def _fallback_questions(self, num_questions: int, strict: bool) -> List[Dict]:
+        """Return the built-in set, or raise it in strict mode."""
+        fallback = self._get_fallback_questions(num_questions)
+        if strict:
+            raise IncompleteQuestionSet(fallback)
+        return fallback
+    
+    async def _request_questions(
+        self,
+        num_questions: int,
+        categories: List[str],
+        difficulty: int,
+        diff_text: str,
+        seed: str,
+        avoid: Optional[List[str]] = None
+    ) -> List[Dict]:
+        """Ask the LLM for a batch of questions in a single call and return the raw list."""
+        avoid_text = ""
+        if avoid:
+            avoid_text = "\n        DO NOT repeat any of these questions:\n" + "\n".join(f"        - {q}" for q in avoid)
         
         prompt = f"""
         Generate exactly {num_questions} unique mind exercise questions for cognitive training.
@@ -107,7 +185,7 @@ class MindExerciseService:
         5. Use randomization seed: {seed} to ensure uniqueness
         6. Questions should be based on cognitive psychology principles
         7. Mix question types evenly across categories
-        
+        {avoid_text}
         CATEGORY DESCRIPTIONS:
         - logical: Syllogisms, if-then statements, deduction puzzles
         - pattern: Number sequences, visual patterns, series completion
@@ -128,36 +206,36 @@ class MindExerciseService:
         Respond ONLY with valid JSON, no other text.
         """
         
-        try:
-            completion = self.client.chat.completions.create(
-                model=self.model_id,
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "You are an expert cognitive psychologist and puzzle designer. Create engaging, scientifically-grounded mental exercises. Always respond with valid JSON only."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.8  # Higher temperature for variety
-            )
-            
-            result = json.loads(completion.choices[0].message.content)
-            questions = result.get('questions', [])
-            
-            # Add category metadata
-            for q in questions:
-                cat_key = q.get('category', 'logical')
-                cat_info = self.CATEGORIES.get(cat_key, self.CATEGORIES['logical'])
-                q['category_name'] = cat_info['name']
-                q['category_icon'] = cat_info['icon']
-            
-            logger.info(f"Generated {len(questions)} mind exercise questions (seed: {seed})")
-            return questions
-            
-        except Exception as e:
-            logger.error(f"Error generating mind exercises: {e}")
-            return self._get_fallback_questions(num_questions)
+        completion = await self.client.chat.completions.create(
+            model=self.model_id,
+            messages=[
+                {
+                    "role": "system", 
+                    "content": "You are an expert cognitive psychologist and puzzle designer. Create engaging, scientifically-grounded mental exercises. Always respond with valid JSON only."
+                },
+                {"role": "user", "content": prompt}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.8  # Higher temperature for variety
+        )
+        
+        result = json.loads(completion.choices[0].message.content)
+        questions = result.get('questions', [])
+        return questions if isinstance(questions, list) else []
+    
+    @staticmethod
+    def _is_valid_question(q) -> bool:
+        """Check a generated question has the fields the exercise pages rely on."""
+        if not isinstance(q, dict):
+            return False
+        # Read by the question page, calculate_results and the answer review
+        for key in _TEXT_FIELDS:
+            if not isinstance(q.get(key), str) or not q[key].strip():
+                return False
+        options = q.get('options')
+        if not isinstance(options, dict) or set(options) != set(_OPTION_KEYS):
+            return False
+        return q.get('correct_answer') in options
     
     def _get_fallback_questions(self, count: int) -> List[Dict]:
         """Return fallback questions if AI generation fails."""
@@ -265,28 +343,30 @@ class MindExerciseService:
         Returns:
             Results summary dictionary
         """
-        correct_count = 0
-        total_time = 0
-        category_scores = {}
+        # Pair each question with its answer (unanswered questions are skipped)
+        answers_by_qid = {a['question_id']: a for a in user_answers}
+        answered = [(q, answers_by_qid[q['id']]) for q in questions if q['id'] in answers_by_qid]
         
-        for q in questions:
-            q_id = q['id']
-            user_answer = next((a for a in user_answers if a['question_id'] == q_id), None)
-            
-            if user_answer:
-                is_correct = user_answer['answer'] == q['correct_answer']
-                if is_correct:
-                    correct_count += 1
-                
-                total_time += user_answer.get('time_taken', 0)
-                
-                # Track by category
-                cat = q['category']
-                if cat not in category_scores:
-                    category_scores[cat] = {'correct': 0, 'total': 0}
-                category_scores[cat]['total'] += 1
-                if is_correct:
-                    category_scores[cat]['correct'] += 1
+        correct = np.fromiter(
+            (a['answer'] == q['correct_answer'] for q, a in answered), dtype=np.bool_, count=len(answered)
+        )
+        times = np.fromiter(
+            (a.get('time_taken', 0) for _, a in answered), dtype=np.float64, count=len(answered)
+        )
+        categories = np.array([q['category'] for q, _ in answered], dtype=object)
+        
+        correct_count = int(correct.sum())
+        total_time = float(times.sum())
+        
+        # Track by category, in the order categories first appear
+        cats, first_seen, cat_idx, totals = np.unique(
+            categories, return_index=True, return_inverse=True, return_counts=True
+        )
+        correct_by_cat = np.bincount(cat_idx.ravel(), weights=correct, minlength=len(cats))
+        category_scores = {
+            cats[i]: {'correct': int(correct_by_cat[i]), 'total': int(totals[i])}
+            for i in np.argsort(first_seen)
+        }
         
         num_questions = len(questions)
         accuracy = (correct_count / num_questions * 100) if num_questions > 0 else 0
@@ -4,14 +4,14 @@ Generates detailed reviews based on interview mode, difficulty, and speech analy
 """
 import json
 from typing import Dict, Optional
-from groq import Groq
+from groq import AsyncGroq
 from app.core.config import settings, InterviewMode, DIFFICULTY_LABELS
 from app.core.logger import logger
 
 class ReviewService:
     def __init__(self):
         self.api_key = settings.GROQ_API_KEY
-        self.client = Groq(api_key=self.api_key)
+        self.client = AsyncGroq(api_key=self.api_key)
         self.model_id = settings.LLM_MODEL
 
     async def analyze_interview(
@@ -122,7 +122,7 @@ class ReviewService:
         """
 
         try:
-            completion = self.client.chat.completions.create(
+            completion = await self.client.chat.completions.create(
                 model=self.model_id,
                 messages=[
                     {"role": "system", "content": f"You are an expert {mode} interview evaluator for {difficulty_label} level positions. Respond only with valid JSON."},
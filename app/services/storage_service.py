@@ -15,29 +15,28 @@ class StorageService:
         self.user_audio_dir.mkdir(parents=True, exist_ok=True)
         self.ai_audio_dir.mkdir(parents=True, exist_ok=True)
     
-    def save_user_audio(self, audio_bytes: bytes, session_id: int, turn_number: int) -> str:
-        """Save user's audio recording and fix metadata using ffmpeg."""
-        temp_filename = f"session_{session_id}_turn_{turn_number}_user_raw.webm"
+    def save_user_audio_file(self, source_path: str, session_id: int, turn_number: int) -> str:
+        """Repair an already-spooled user recording with ffmpeg straight into storage."""
         final_filename = f"session_{session_id}_turn_{turn_number}_user.webm"
-        
-        temp_path = self.user_audio_dir / temp_filename
         final_path = self.user_audio_dir / final_filename
         
         try:
-            with open(temp_path, 'wb') as f:
-                f.write(audio_bytes)
-            
             subprocess.run([
-                'ffmpeg', '-y', '-i', str(temp_path), 
+                'ffmpeg', '-y', '-i', str(source_path), 
                 '-c', 'copy', str(final_path)
             ], check=True, capture_output=True)
             
-            temp_path.unlink()
             logger.info(f"Saved and repaired user audio: {final_filename}")
             return str(final_path)
         except Exception as e:
             logger.error(f"Error saving user audio for session {session_id}: {e}")
-            return str(temp_path) if temp_path.exists() else None
+            # Keep the unrepaired recording rather than losing it
+            raw_path = self.user_audio_dir / f"session_{session_id}_turn_{turn_number}_user_raw.webm"
+            try:
+                shutil.copy(source_path, raw_path)
+                return str(raw_path)
+            except OSError:
+                return None
     
     def save_ai_audio(self, audio_path: str, session_id: int, turn_number: int) -> str:
         """Copy AI-generated audio to permanent storage."""
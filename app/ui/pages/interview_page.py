@@ -3,18 +3,40 @@ Interview Page - Premium Interview Interface.
 Modern, polished design with glassmorphism and professional styling.
 """
 import streamlit as st
-import asyncio
 import textwrap
-import os
-from streamlit_mic_recorder import mic_recorder
-from app.core.config import InterviewMode, DIFFICULTY_LABELS
-from app.logic.interview_handler import process_audio_turn, start_new_interview
+import hashlib
+import itertools
+import queue
+import string
+import threading
+import time
+from markupsafe import escape
+from app.core import asyncio_runtime
+from app.core.config import InterviewMode, DIFFICULTY_LABELS, difficulty_tier
+from app.logic.interview_handler import (
+    begin_audio_turn,
+    spool_audio,
+    synthesize_filler,
+    process_audio_turn,
+    collect_pending_turn,
+    start_new_interview
+)
 
-def render_mode_selection():
-    """Render the premium interview mode and difficulty selection page."""
-    
-    # Premium CSS
-    st.markdown("""
+
+# (badge_class, description, color) per difficulty tier
+_DIFF_TIER_META = (
+    ("badge-easy", "Friendly • Basic Questions • Hints Available", "#10b981"),
+    ("badge-medium", "Professional • Solid Fundamentals • Standard Expectations", "#f59e0b"),
+    ("badge-hard", "Challenging • Optimization Required • Edge Cases Expected", "#f87171"),
+    ("badge-elite", "Intense • Near-Perfect Answers • Deep Expertise Required", "#ef4444"),
+)
+
+# Difficulty lookup table indexed by level (0-10), built once at import
+_DIFF_META = tuple(_DIFF_TIER_META[difficulty_tier(d)] for d in range(11))
+
+# Page stylesheets, emitted on every rerun (Streamlit drops elements that
+# are not re-emitted, so the string is built once and reused)
+_MODE_CSS = """
     <style>
     .selection-header {
         background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
@@ -72,139 +94,9 @@ def render_mode_selection():
     .badge-hard { background: linear-gradient(135deg, #f87171 0%, #ef4444 100%); }
     .badge-elite { background: linear-gradient(135deg, #ef4444 0%, #dc2626 100%); }
     </style>
-    """, unsafe_allow_html=True)
-    
-    st.markdown('<h1 class="selection-header">🎯 Interview Setup</h1>', unsafe_allow_html=True)
-    
-    # Difficulty Selection
-    st.markdown("### Select Difficulty Level")
-    st.markdown('<div class="difficulty-card">', unsafe_allow_html=True)
-    
-    difficulty = st.slider(
-        "Interview Difficulty",
-        min_value=1,
-        max_value=10,
-        value=5,
-        help="1 = Friendly Startup | 10 = Elite FAANG",
-        key="difficulty_slider",
-        label_visibility="collapsed"
-    )
-    
-    difficulty_label = DIFFICULTY_LABELS.get(difficulty, "Unknown")
-    
-    # Dynamic difficulty badge
-    if difficulty <= 3:
-        badge_class = "badge-easy"
-        diff_desc = "Friendly • Basic Questions • Hints Available"
-    elif difficulty <= 6:
-        badge_class = "badge-medium"
-        diff_desc = "Professional • Solid Fundamentals • Standard Expectations"
-    elif difficulty <= 8:
-        badge_class = "badge-hard"
-        diff_desc = "Challenging • Optimization Required • Edge Cases Expected"
-    else:
-        badge_class = "badge-elite"
-        diff_desc = "Intense • Near-Perfect Answers • Deep Expertise Required"
-    
-    st.markdown(f"""
-        <div style="text-align: center; margin-top: 20px;">
-            <span class="difficulty-badge {badge_class}">Level {difficulty}: {difficulty_label}</span>
-            <p style="color: #a0aec0; margin-top: 10px;">{diff_desc}</p>
-        </div>
-    """, unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
-    
-    # Optional CV Upload Section
-    st.markdown("### 📄 Upload Your CV (Optional)")
-    st.markdown("""
-    <div style="background: rgba(99, 102, 241, 0.1); border: 1px dashed rgba(99, 102, 241, 0.4); 
-                border-radius: 16px; padding: 20px; text-align: center; margin-bottom: 20px;">
-        <p style="color: #a0aec0; margin-bottom: 10px;">
-            Upload your resume for a <strong>personalized interview</strong>. 
-            Questions will be based on your experience, projects, and skills.
-        </p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    uploaded_cv = st.file_uploader(
-        "Upload CV (PDF only)", 
-        type=["pdf"], 
-        key="cv_uploader",
-        label_visibility="collapsed"
-    )
-    
-    if uploaded_cv is not None:
-        # Parse the CV
-        from app.services.cv_parser import parse_cv, summarize_cv_for_prompt
-        cv_bytes = uploaded_cv.read()
-        cv_text = parse_cv(cv_bytes)
-        
-        if cv_text:
-            cv_summary = summarize_cv_for_prompt(cv_text)
-            st.session_state.cv_content = cv_summary
-            st.success(f"✅ CV uploaded successfully! ({len(cv_text)} characters extracted)")
-            
-            with st.expander("📋 Preview extracted CV content"):
-                st.text(cv_text[:1500] + ("..." if len(cv_text) > 1500 else ""))
-        else:
-            st.warning("⚠️ Could not extract text from the PDF. Try a different file or proceed without CV.")
-            st.session_state.cv_content = ""
-    else:
-        st.session_state.cv_content = ""
-    
-    # Mode Selection Cards
-    st.markdown("### Choose Interview Type")
-
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("""
-        <div class="mode-card">
-            <div class="mode-icon">💻</div>
-            <div class="mode-title">Technical Interview</div>
-            <div class="mode-desc">
-                • Coding Problems & Algorithms<br>
-                • System Design Questions<br>
-                • Technical Deep Dives<br>
-                • Problem-Solving Approach<br><br>
-                <em>Best for: Engineers, Data Scientists, DevOps</em>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        if st.button("🚀 Start Technical", key="tech_btn", use_container_width=True, type="primary"):
-            st.session_state.mode_selected = True
-            st.session_state.interview_mode = InterviewMode.TECHNICAL
-            st.session_state.difficulty_level = difficulty
-            start_new_interview(mode=InterviewMode.TECHNICAL, difficulty=difficulty)
-            st.rerun()
-    
-    with col2:
-        st.markdown("""
-        <div class="mode-card">
-            <div class="mode-icon">🤝</div>
-            <div class="mode-title">HR Interview</div>
-            <div class="mode-desc">
-                • Behavioral Questions (STAR)<br>
-                • Communication Assessment<br>
-                • Cultural Fit Evaluation<br>
-                • Soft Skills Analysis<br><br>
-                <em>Best for: All Roles, Leadership Positions</em>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
-        if st.button("🚀 Start HR", key="hr_btn", use_container_width=True, type="primary"):
-            st.session_state.mode_selected = True
-            st.session_state.interview_mode = InterviewMode.HR
-            st.session_state.difficulty_level = difficulty
-            start_new_interview(mode=InterviewMode.HR, difficulty=difficulty)
-            st.rerun()
+"""
 
-def render_interview_page():
-    """Render the premium interview interface."""
-    
-    # Premium CSS
-    st.markdown("""
+_INTERVIEW_CSS = """
     <style>
     .interview-header {
         display: flex;
@@ -277,137 +169,79 @@ def render_interview_page():
         font-size: 0.85rem;
     }
     </style>
-    """, unsafe_allow_html=True)
-    
-    # Show current mode and difficulty
-    mode = st.session_state.get("interview_mode", InterviewMode.TECHNICAL)
-    difficulty = st.session_state.get("difficulty_level", 5)
-    difficulty_label = DIFFICULTY_LABELS.get(difficulty, "Unknown")
-    
-    mode_emoji = "💻" if mode == InterviewMode.TECHNICAL else "🤝"
-    mode_name = "Technical" if mode == InterviewMode.TECHNICAL else "HR"
-    
-    # Difficulty color coding
-    if difficulty <= 3:
-        diff_color = "#10b981"
-    elif difficulty <= 6:
-        diff_color = "#f59e0b"
-    elif difficulty <= 8:
-        diff_color = "#f87171"
-    else:
-        diff_color = "#ef4444"
-    
-    # Header with RAG indicator
-    rag_active = st.session_state.get("rag_active", False)
-    rag_badge = '<span style="background: #10b981; padding: 6px 12px; border-radius: 20px; font-size: 0.8rem; margin-left: 10px;">📚 JD Active</span>' if rag_active else ''
-    
-    st.markdown(f"""
-        <div class="interview-header">
-            <span class="interview-title">{mode_emoji} {mode_name} Interview {rag_badge}</span>
-            <span class="level-badge" style="background: {diff_color};">
-                Level {difficulty}: {difficulty_label}
-            </span>
-        </div>
-    """, unsafe_allow_html=True)
-    
-    # AI Card
-    st.markdown(f"""
-        <div class="ai-card">
-            <div class="ai-avatar">🎙️</div>
-            <h3 style="color: #667eea; margin-bottom: 15px;">AI Interviewer</h3>
-            <div class="ai-speech">
-                "{st.session_state.last_ai_message}"
-            </div>
-        </div>
-    """, unsafe_allow_html=True)
+"""
 
-    # AI Voice Autoplay
-    turn_num = st.session_state.turn_number
-    session_id = st.session_state.session_id
-    
-    if turn_num == 0:
-        audio_path = f"audio_outputs/welcome_{session_id}.mp3"
-    else:
-        audio_path = f"stored_interviews/ai/session_{session_id}_turn_{turn_num}_ai.mp3"
-    
-    # Only show audio player if user is NOT ready to record yet
-    # This prevents audio playback from interfering with mic access
-    if os.path.exists(audio_path) and not st.session_state.get("ready_to_record", False):
-        st.audio(audio_path, autoplay=True)
-        st.info("🔊 Listen to the AI's question above, then click the button below when you're ready to respond.")
+# Interview header and AI card; substituted per rerun instead of rebuilding f-strings
+_HEADER_TMPL = string.Template("""
+<div class="interview-header">
+    <span class="interview-title">$emoji $name Interview $rag_badge</span>
+    <span class="level-badge" style="background: $color;">
+        Level $level: $label
+    </span>
+</div>
+""")
 
-    # User Recording Section
-    st.markdown("### 🎤 Your Response")
-    
-    # Two-step flow to avoid audio/mic conflicts
-    if not st.session_state.get("ready_to_record", False):
-        # Step 1: User clicks "Ready to Respond" after hearing AI
-        st.markdown("""
-        <div style="background: rgba(99, 102, 241, 0.1); border: 1px solid rgba(99, 102, 241, 0.3); 
-                    border-radius: 12px; padding: 20px; text-align: center; margin: 15px 0;">
-            <p style="color: #a0aec0; margin-bottom: 10px; font-size: 0.95rem;">
-                ⏸️ Finished listening? Click below to enable your microphone.
-            </p>
-        </div>
-        """, unsafe_allow_html=True)
-        
-        if st.button("✅ I'm Ready to Respond", key="ready_btn", use_container_width=True, type="primary"):
-            st.session_state.ready_to_record = True
-            st.session_state.recorder_key += 1  # Reset recorder for fresh state
-            st.rerun()
-    else:
-        # Step 2: Show microphone recorder
-        st.caption("💡 If the button doesn't respond, check your browser's microphone permissions (click the 🔒 icon in the address bar).")
-        
-        audio = mic_recorder(
-            start_prompt="🎙️ Start Recording",
-            stop_prompt="⏹️ Submit Answer",
-            just_once=True,  # Reset after each recording for reliability
-            format="webm",   # Explicit format for Whisper API compatibility
-            key=f"mic_{st.session_state.recorder_key}",
-            use_container_width=True
-        )
+_AI_CARD_TMPL = string.Template("""
+<div class="ai-card">
+    <div class="ai-avatar">🎙️</div>
+    <h3 style="color: #667eea; margin-bottom: 15px;">AI Interviewer</h3>
+    <div class="ai-speech">
+        "$message"
+    </div>
+</div>
+""")
 
-        if audio and audio.get('bytes'):
-            # Reset ready_to_record for next turn
-            st.session_state.ready_to_record = False
-            with st.spinner("🔄 Analyzing your response..."):
-                asyncio.run(process_audio_turn(audio['bytes']))
-            st.rerun()
+_AI_CARD_MAX_CHARS = 800
 
+_MINI_TMPL = """
+<div class="analytics-mini">
+    <div class="mini-stat">
+        <div class="mini-value">%s</div>
+        <div class="mini-label">Words</div>
+    </div>
+    <div class="mini-stat">
+        <div class="mini-value">%s</div>
+        <div class="mini-label">Fillers</div>
+    </div>
+    <div class="mini-stat">
+        <div class="mini-value">%s%%</div>
+        <div class="mini-label">Fluency</div>
+    </div>
+</div>
+"""
 
-    # Live Analytics (if available)
-    if st.session_state.get("turn_analytics"):
-        latest = st.session_state.turn_analytics[-1]
-        st.markdown(f"""
-            <div class="analytics-mini">
-                <div class="mini-stat">
-                    <div class="mini-value">{latest.get("word_count", 0)}</div>
-                    <div class="mini-label">Words</div>
-                </div>
-                <div class="mini-stat">
-                    <div class="mini-value">{latest.get("total_fillers", 0)}</div>
-                    <div class="mini-label">Fillers</div>
-                </div>
-                <div class="mini-stat">
-                    <div class="mini-value">{latest.get("fluency_score", 0)}%</div>
-                    <div class="mini-label">Fluency</div>
-                </div>
-            </div>
-        """, unsafe_allow_html=True)
+# Static mode cards for the setup page
+_TECH_CARD_HTML = """
+<div class="mode-card">
+    <div class="mode-icon">💻</div>
+    <div class="mode-title">Technical Interview</div>
+    <div class="mode-desc">
+        • Coding Problems &amp; Algorithms<br>
+        • System Design Questions<br>
+        • Technical Deep Dives<br>
+        • Problem-Solving Approach<br><br>
+        <em>Best for: Engineers, Data Scientists, DevOps</em>
+    </div>
+</div>
+"""
 
-    # Transcript Expander
-    with st.expander("📜 View Transcript"):
-        for msg in st.session_state.messages:
-            icon = "🤖" if msg["role"] == "assistant" else "👤"
-            role_color = "#667eea" if msg["role"] == "assistant" else "#10b981"
-            st.markdown(f"<span style='color: {role_color}; font-weight: 600;'>{icon} {msg['role'].capitalize()}:</span> {msg['content']}", unsafe_allow_html=True)
+_HR_CARD_HTML = """
+<div class="mode-card">
+    <div class="mode-icon">🤝</div>
+    <div class="mode-title">HR Interview</div>
+    <div class="mode-desc">
+        • Behavioral Questions (STAR)<br>
+        • Communication Assessment<br>
+        • Cultural Fit Evaluation<br>
+        • Soft Skills Analysis<br><br>
+        <em>Best for: All Roles, Leadership Positions</em>
+    </div>
+</div>
+"""
 
-def render_welcome_page():
-    """Render a premium welcome page using st.html for bulletproof rendering."""
-    
-    # Define HTML separately with NO LEADING SPACES to avoid markdown issues
-    welcome_styles = """
+# Welcome page markup (styles + content), fully static.
+# Defined with NO LEADING SPACES to avoid markdown issues
+_WELCOME_FULL_HTML = """
 <style>
 @keyframes glowFade {
     0% { opacity: 0; transform: translateY(20px); }
@@ -492,8 +326,6 @@ def render_welcome_page():
     line-height: 1.6; 
 }
 </style>
-"""
-    welcome_content = """
 <div class="welcome-container">
     <div class="hero-box">
         <h1 class="hero-title">AI Interview Coach</h1>
@@ -523,8 +355,356 @@ def render_welcome_page():
     </div>
 </div>
 """
+
+
+_prewarm_started = False
+
+
+def _prewarm_interview_imports():
+    """Import the mic recorder in the background while the user is on the setup page."""
+    global _prewarm_started
+    if _prewarm_started:
+        return
+    _prewarm_started = True
+    threading.Thread(target=lambda: __import__("streamlit_mic_recorder"), daemon=True).start()
+
+
+_DIFF_LEVELS = tuple(range(1, 11))
+
+
+def _format_level(level: int) -> str:
+    """Slider label for a difficulty level."""
+    return f"Level {level}: {DIFFICULTY_LABELS.get(level, 'Unknown')}"
+
+
+def _difficulty_legend() -> str:
+    """Static legend of difficulty tiers, grouped from _DIFF_META."""
+    rows = []
+    for (badge_class, diff_desc, _), levels in itertools.groupby(_DIFF_LEVELS, key=lambda d: _DIFF_META[d]):
+        levels = list(levels)
+        rows.append(
+            f'<p style="margin: 8px 0;"><span class="difficulty-badge {badge_class}">Levels {levels[0]}-{levels[-1]}</span> '
+            f'<span style="color: #a0aec0;">{diff_desc}</span></p>'
+        )
+    return f'<div style="text-align: center; margin-top: 20px;">{"".join(rows)}</div>'
+
+_DIFF_LEGEND_HTML = _difficulty_legend()
+
+# Transcript line template and per-role (icon, color) styling
+_MSG_TEMPLATE = '<div><span style="color: {color}; font-weight: 600;">{icon} {role}:</span> {content}</div>'
+_ROLE_STYLES = {"assistant": ("🤖", "#667eea"), "user": ("👤", "#10b981")}
+
+
+def _render_message(role: str, content: str) -> str:
+    """Render one transcript line."""
+    icon, color = _ROLE_STYLES.get(role, _ROLE_STYLES["user"])
+    return _MSG_TEMPLATE.format_map({
+        "color": color,
+        "icon": icon,
+        "role": role.capitalize(),
+        "content": escape(content),
+    })
+
+
+def _transcript_html(messages: list) -> str:
+    """Return the transcript HTML, rendering only messages added since the last rerun."""
+    cached = st.session_state.get("_transcript_cache")
+    # A new interview replaces the messages list, so start over in that case
+    if cached is None or cached[0] is not messages or cached[1] > len(messages):
+        cached = (messages, 0, "")
+    _, rendered, transcript = cached
+    if rendered < len(messages):
+        transcript += "".join(_render_message(m["role"], m["content"]) for m in messages[rendered:])
+        st.session_state["_transcript_cache"] = (messages, len(messages), transcript)
+    return transcript
+
+def _start_interview(mode: str, difficulty: int):
+    """Start an interview with the chosen mode and difficulty."""
+    st.session_state.mode_selected = True
+    st.session_state.interview_mode = mode
+    st.session_state.difficulty_level = difficulty
+    start_new_interview(mode=mode, difficulty=difficulty)
+    st.rerun()
+
+def render_mode_selection():
+    """Render the premium interview mode and difficulty selection page."""
+    _prewarm_interview_imports()
+    
+    # Premium CSS
+    st.markdown(_MODE_CSS, unsafe_allow_html=True)
+    
+    st.markdown('<h1 class="selection-header">🎯 Interview Setup</h1>', unsafe_allow_html=True)
+    
+    # Optional CV Upload Section
+    st.markdown("### 📄 Upload Your CV (Optional)")
+    st.markdown("""
+    <div style="background: rgba(99, 102, 241, 0.1); border: 1px dashed rgba(99, 102, 241, 0.4); 
+                border-radius: 16px; padding: 20px; text-align: center; margin-bottom: 20px;">
+        <p style="color: #a0aec0; margin-bottom: 10px;">
+            Upload your resume for a <strong>personalized interview</strong>. 
+            Questions will be based on your experience, projects, and skills.
+        </p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    uploaded_cv = st.file_uploader(
+        "Upload CV (PDF only)", 
+        type=["pdf"], 
+        key="cv_uploader",
+        label_visibility="collapsed"
+    )
+    
+    if uploaded_cv is not None:
+        # Parse only when a different upload arrives; reruns reuse the stored result
+        if st.session_state.cv_file_id != uploaded_cv.file_id:
+            cv_text, cv_summary = _cached_parse_cv(_cv_signature(uploaded_cv), uploaded_cv)
+            st.session_state.update(cv_file_id=uploaded_cv.file_id, cv_text=cv_text, cv_content=cv_summary)
+        cv_text = st.session_state.cv_text
+    
+        if cv_text:
+            st.success(f"✅ CV uploaded successfully! ({len(cv_text)} characters extracted)")
+        
+            with st.expander("📋 Preview extracted CV content"):
+                st.text(cv_text[:1500] + ("..." if len(cv_text) > 1500 else ""))
+        else:
+            st.warning("⚠️ Could not extract text from the PDF. Try a different file or proceed without CV.")
+    elif st.session_state.cv_file_id is not None:
+        # The user removed their upload; otherwise keep any CV already parsed
+        st.session_state.update(cv_file_id=None, cv_text="", cv_content="")
+    
+    # Difficulty and the Start buttons live in a form so dragging the slider
+    # doesn't rerun the page; the CV uploader stays outside so its feedback
+    # shows as soon as a file is picked
+    with st.form("interview_setup", clear_on_submit=False, border=False):
+        # Difficulty Selection
+        st.markdown("### Select Difficulty Level")
+        st.markdown('<div class="difficulty-card">', unsafe_allow_html=True)
+        
+        # The level label is formatted client-side, so it updates without a rerun
+        difficulty = st.select_slider(
+            "Interview Difficulty",
+            options=_DIFF_LEVELS,
+            value=5,
+            format_func=_format_level,
+            help="1 = Friendly Startup | 10 = Elite FAANG",
+            key="difficulty_slider",
+            label_visibility="collapsed"
+        )
+        
+        st.html(_DIFF_LEGEND_HTML)
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Mode Selection Cards
+        st.markdown("### Choose Interview Type")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.html(_TECH_CARD_HTML)
+            if st.form_submit_button("🚀 Start Technical", use_container_width=True, type="primary"):
+                _start_interview(InterviewMode.TECHNICAL, difficulty)
+        
+        with col2:
+            st.html(_HR_CARD_HTML)
+            if st.form_submit_button("🚀 Start HR", use_container_width=True, type="primary"):
+                _start_interview(InterviewMode.HR, difficulty)
+
+def _cv_signature(cv_file) -> tuple:
+    """Content identity for an uploaded PDF: size plus a hash of the whole file."""
+    # The cache is shared across users, so the key must cover every byte
+    with cv_file.getbuffer() as buf:
+        return (len(buf), hashlib.blake2b(buf, digest_size=32).digest())
+
+
+@st.cache_data(show_spinner=False, ttl=3600, max_entries=16)
+def _cached_parse_cv(signature: tuple, _cv_file) -> tuple:
+    """Parse and summarize a CV once per signature; _cv_file is excluded from the cache key."""
+    from app.services.cv_parser import parse_cv, summarize_cv_for_prompt
+    # UploadedFile is already a binary stream; hand it to the parser directly
+    _cv_file.seek(0)
+    cv_text = parse_cv(_cv_file)
+    return cv_text, summarize_cv_for_prompt(cv_text)
+
+async def _run_audio_turn(audio_bytes: bytes, turn: dict, on_update):
+    """Spool the recording to disk, then process the turn from the file."""
+    audio_path = await spool_audio(audio_bytes)
+    return await process_audio_turn(audio_path, turn, on_update=on_update)
+
+def _wait_for_turn():
+    """Show progress for the pending audio turn, then apply it and rerun the page."""
+    pending = st.session_state.pending_turn
+    future, updates = pending["future"], pending["updates"]
+    status = st.status("🎧 Transcribing your response...", expanded=False)
+    # Outside the collapsed status so the reply is visible while it streams
+    stream_slot = st.empty()
+    while True:
+        finished = future.done()
+        while not updates.empty():
+            stage, text = updates.get()
+            if stage == "transcribed":
+                status.write("📝 Transcribed")
+                status.update(label="🤖 Generating response...")
+            elif stage == "token":
+                # Show the AI reply as it arrives instead of waiting for the full turn
+                stream_slot.markdown(f'<div class="ai-speech">"{escape(text)}"</div>', unsafe_allow_html=True)
+            elif stage == "voice":
+                status.write("🤖 Response generated")
+                status.update(label="🔊 Synthesizing voice...")
+        if finished:
+            break
+        time.sleep(0.1)
+    if collect_pending_turn():
+        status.update(label="✅ Response ready", state="complete")
+    else:
+        # A toast survives the rerun below, unlike the status label
+        st.toast("⚠️ Recording too short or could not be processed, please try again")
+    st.rerun()  # Full rerun: header, AI card and transcript changed
+
+
+@st.fragment
+def _recorder_and_analytics():
+    """Render the AI voice, response recorder and live analytics as an isolated fragment."""
+    # Deferred so the welcome and setup pages don't pay for this import
+    from streamlit_mic_recorder import mic_recorder
+
+    # A turn left running by an interrupted run: keep showing its progress
+    if st.session_state.get("pending_turn") is not None:
+        _wait_for_turn()
+        return
+
+    # AI Voice Autoplay
+    # Lives in the fragment so the Ready click only redraws audio and recorder
+    # Bytes are stored by the handler when the turn advances
+    ai_audio = st.session_state.last_ai_audio
+    
+    # Only show audio player if user is NOT ready to record yet
+    # This prevents audio playback from interfering with mic access
+    if ai_audio and not st.session_state.get("ready_to_record", False):
+        # Autoplay only on the first render of a turn so later reruns don't replay it
+        turn_key = (st.session_state.session_id, st.session_state.turn_number)
+        first_emit = st.session_state.get("_audio_emitted_turn") != turn_key
+        st.audio(ai_audio, format="audio/mp3", autoplay=first_emit)
+        st.session_state["_audio_emitted_turn"] = turn_key
+        st.info("🔊 Listen to the AI's question above, then click the button below when you're ready to respond.")
+
+    # User Recording Section
+    st.markdown("### 🎤 Your Response")
+    
+    # Two-step flow to avoid audio/mic conflicts
+    if not st.session_state.get("ready_to_record", False):
+        # Step 1: User clicks "Ready to Respond" after hearing AI
+        st.markdown("""
+        <div style="background: rgba(99, 102, 241, 0.1); border: 1px solid rgba(99, 102, 241, 0.3); 
+                    border-radius: 12px; padding: 20px; text-align: center; margin: 15px 0;">
+            <p style="color: #a0aec0; margin-bottom: 10px; font-size: 0.95rem;">
+                ⏸️ Finished listening? Click below to enable your microphone.
+            </p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.button("✅ I'm Ready to Respond", key="ready_btn", use_container_width=True, type="primary"):
+            st.session_state.ready_to_record = True
+            st.session_state.recorder_key += 1  # Reset recorder for fresh state
+            # Prefetch the filler clip while the user is answering
+            st.session_state.filler_future = asyncio_runtime.submit(synthesize_filler())
+            st.rerun(scope="fragment")  # Hides the audio player; header, card and transcript are unchanged
+    else:
+        # Step 2: Show microphone recorder
+        st.caption("💡 If the button doesn't respond, check your browser's microphone permissions (click the 🔒 icon in the address bar).")
+        
+        audio = mic_recorder(
+            start_prompt="🎙️ Start Recording",
+            stop_prompt="⏹️ Submit Answer",
+            just_once=True,  # Reset after each recording for reliability
+            format="webm",   # Explicit format for Whisper API compatibility
+            key=f"mic_{st.session_state.recorder_key}",
+            use_container_width=True
+        )
+
+        if audio and audio.get('bytes'):
+            # Reset ready_to_record for next turn
+            st.session_state.ready_to_record = False
+            turn = begin_audio_turn()
+            updates = queue.SimpleQueue()
+
+            async def _on_update(stage: str, text: str):
+                # Called on the worker thread; the script thread renders it below
+                updates.put((stage, text))
+
+            # Stored before anything is drawn: if the user interrupts this run,
+            # the next run picks the turn up instead of losing it
+            st.session_state.pending_turn = {
+                "turn": turn,
+                "future": asyncio_runtime.submit(_run_audio_turn(audio['bytes'], turn, _on_update)),
+                "updates": updates,
+            }
+
+            # Play the prefetched acknowledgement so the wait isn't silent
+            filler = st.session_state.get("filler_future")
+            if filler is not None and filler.done() and filler.exception() is None and filler.result():
+                st.audio(filler.result(), format="audio/mp3", autoplay=True)
+
+            _wait_for_turn()
+
+
+    # Live Analytics (if available)
+    if st.session_state.get("turn_analytics"):
+        latest = st.session_state.turn_analytics[-1]
+        sig = (latest.get("word_count", 0), latest.get("total_fillers", 0), latest.get("fluency_score", 0))
+        # Reformat only when the numbers change; reruns re-emit the identical string
+        if st.session_state.get("_mini_sig") != sig:
+            st.session_state.update(_mini_sig=sig, _mini_html=_MINI_TMPL % sig)
+        st.html(st.session_state["_mini_html"])
+
+
+def render_interview_page():
+    """Render the premium interview interface."""
+    
+    # Premium CSS
+    st.markdown(_INTERVIEW_CSS, unsafe_allow_html=True)
+    
+    # Show current mode and difficulty
+    mode = st.session_state.get("interview_mode", InterviewMode.TECHNICAL)
+    difficulty = st.session_state.get("difficulty_level", 5)
+    difficulty_label = DIFFICULTY_LABELS.get(difficulty, "Unknown")
+    
+    mode_emoji = "💻" if mode == InterviewMode.TECHNICAL else "🤝"
+    mode_name = "Technical" if mode == InterviewMode.TECHNICAL else "HR"
+    
+    # Difficulty color coding
+    _, _, diff_color = _DIFF_META[difficulty]
+    
+    # Header with RAG indicator
+    rag_active = st.session_state.get("rag_active", False)
+    rag_badge = '<span style="background: #10b981; padding: 6px 12px; border-radius: 20px; font-size: 0.8rem; margin-left: 10px;">📚 JD Active</span>' if rag_active else ''
+    
+    st.html(_HEADER_TMPL.substitute(
+        emoji=mode_emoji,
+        name=mode_name,
+        rag_badge=rag_badge,
+        color=diff_color,
+        level=difficulty,
+        label=difficulty_label,
+    ))
+    
+    # AI Card
+    # The card shows a capped excerpt; the full reply stays in the transcript
+    card_text = textwrap.shorten(st.session_state.last_ai_message, _AI_CARD_MAX_CHARS, placeholder="…")
+    st.html(_AI_CARD_TMPL.substitute(message=escape(card_text)))
+
+    # Audio, recorder and live analytics rerun on their own as the user interacts
+    _recorder_and_analytics()
+
+    # Transcript Expander
+    with st.expander("📜 View Transcript"):
+        if st.session_state.messages:
+            st.html(_transcript_html(st.session_state.messages))
+
+def render_welcome_page():
+    """Render a premium welcome page using st.html for bulletproof rendering."""
+    
     # Use st.html for guaranteed rendering
-    st.html(welcome_styles + welcome_content)
+    st.html(_WELCOME_FULL_HTML)
 
     # Use native Streamlit button for functionality
     col1, col2, col3 = st.columns([1, 1.5, 1])
@@ -3,65 +3,69 @@ Mind Exercise Page - Timed Logic Puzzles and Riddles.
 A separate page for cognitive training with unique questions per session.
 """
 import streamlit as st
-import asyncio
-from datetime import datetime
-from app.services.mind_exercise_service import MindExerciseService
-
-# Initialize service
-_mind_service = None
+import functools
+import secrets
+import time
+from app.core import asyncio_runtime
+from app.core.config import difficulty_tier
 
+# Initialize service once per process
+@functools.cache
 def get_mind_service():
-    global _mind_service
-    if _mind_service is None:
-        _mind_service = MindExerciseService()
-    return _mind_service
+    # Deferred until Mind Gym is first opened
+    from app.services.mind_exercise_service import MindExerciseService
+    return MindExerciseService()
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_question_set(num_questions: int, categories: tuple, difficulty: int) -> list:
+    """Generate one full question set per configuration and reuse it for an hour."""
+    # strict: a short or fallback set raises IncompleteQuestionSet, which st.cache_data doesn't cache
+    return asyncio_runtime.run(get_mind_service().generate_questions(
+        num_questions=num_questions,
+        categories=list(categories) or None,
+        difficulty=difficulty,
+        strict=True
+    ))
+
+
+# Difficulty description per tier, and a lookup indexed by level (0-10)
+_DIFF_TIER_TEXT = (
+    "🟢 Warm-Up Mode - Quick, confidence-building questions",
+    "🟡 Standard Mode - Balanced challenge for daily practice",
+    "🟠 Challenge Mode - Push your cognitive limits",
+    "🔴 Expert Mode - Only for the mentally elite!",
+)
+_DIFF_TEXT = tuple(_DIFF_TIER_TEXT[difficulty_tier(d)] for d in range(11))
+
+def _render_questions(questions: list) -> list:
+    """Build the static header, body and option labels for every question up front."""
+    total = len(questions)
+    rendered = []
+    for idx, question in enumerate(questions):
+        rendered.append({
+            "header": f"""
+    <div class="question-header">
+        <span class="question-progress">Question {idx + 1} of {total}</span>
+        <span class="question-category">{question.get('category_icon', '🧠')} {question.get('category_name', 'Logic')}</span>
+    </div>
+    """,
+            "body": f"""
+    <div class="timer-display">
+        ⏱️ Suggested time: {question.get('time_limit', 30)} seconds
+    </div>
+    <div class="question-box">
+        <div class="question-text">{question.get('question', 'Question not available')}</div>
+    </div>
+    """,
+            "options": [f"{k}: {v}" for k, v in question.get('options', {}).items()],
+        })
+    return rendered
 
 
 def render_mind_exercise_welcome():
     """Render the welcome/setup page for mind exercises."""
     
-    # Premium CSS
-    st.markdown("""
-    <style>
-    .mind-header {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 2.5rem;
-        font-weight: 700;
-        text-align: center;
-        margin-bottom: 10px;
-    }
-    .mind-subtitle {
-        text-align: center;
-        color: #a0aec0;
-        font-size: 1.1rem;
-        margin-bottom: 30px;
-    }
-    .category-card {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
-        border: 1px solid rgba(99, 102, 241, 0.3);
-        border-radius: 16px;
-        padding: 20px;
-        text-align: center;
-        margin: 10px 0;
-    }
-    .category-icon {
-        font-size: 2.5rem;
-        margin-bottom: 10px;
-    }
-    .category-name {
-        font-size: 1.1rem;
-        font-weight: 600;
-        color: #e2e8f0;
-    }
-    .category-desc {
-        font-size: 0.85rem;
-        color: #a0aec0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
     st.markdown('<h1 class="mind-header">🧩 Mind Gym</h1>', unsafe_allow_html=True)
     st.markdown('<p class="mind-subtitle">Sharpen your cognitive skills with AI-generated puzzles</p>', unsafe_allow_html=True)
     
@@ -70,16 +74,14 @@ def render_mind_exercise_welcome():
     categories = service.CATEGORIES
     
     st.markdown("### 📚 Exercise Categories")
-    cols = st.columns(5)
-    for idx, (key, cat) in enumerate(categories.items()):
-        with cols[idx]:
-            st.markdown(f"""
-            <div class="category-card">
-                <div class="category-icon">{cat['icon']}</div>
-                <div class="category-name">{cat['name']}</div>
-                <div class="category-desc">{cat['cognitive_skill']}</div>
-            </div>
-            """, unsafe_allow_html=True)
+    # One element laid out by CSS grid instead of a card per column
+    cards_html = "".join(
+        f'<div class="category-card"><div class="category-icon">{cat["icon"]}</div>'
+        f'<div class="category-name">{cat["name"]}</div>'
+        f'<div class="category-desc">{cat["cognitive_skill"]}</div></div>'
+        for cat in categories.values()
+    )
+    st.markdown(f'<div class="category-grid">{cards_html}</div>', unsafe_allow_html=True)
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -108,16 +110,7 @@ def render_mind_exercise_welcome():
         )
     
     # Difficulty description
-    if difficulty <= 3:
-        diff_text = "🟢 Warm-Up Mode - Quick, confidence-building questions"
-    elif difficulty <= 6:
-        diff_text = "🟡 Standard Mode - Balanced challenge for daily practice"
-    elif difficulty <= 8:
-        diff_text = "🟠 Challenge Mode - Push your cognitive limits"
-    else:
-        diff_text = "🔴 Expert Mode - Only for the mentally elite!"
-    
-    st.info(diff_text)
+    st.info(_DIFF_TEXT[difficulty])
     
     # Category selection
     selected_categories = st.multiselect(
@@ -127,29 +120,43 @@ def render_mind_exercise_welcome():
         key="mind_categories"
     )
     
+    fresh_set = st.checkbox(
+        "🎲 Generate fresh set",
+        key="mind_fresh_set",
+        help="Ask the AI for brand-new questions instead of reusing a recent set with the same settings"
+    )
+    
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Start button
     if st.button("🚀 Start Mind Exercise", use_container_width=True, type="primary"):
-        # Generate unique session
-        import random
-        user_seed = f"user_{random.randint(10000, 99999)}_{datetime.now().timestamp()}"
-        
         with st.spinner("🧠 Generating your personalized questions..."):
-            service = get_mind_service()
-            questions = asyncio.run(service.generate_questions(
-                num_questions=num_questions,
-                categories=selected_categories if selected_categories else None,
-                difficulty=difficulty,
-                user_seed=user_seed
-            ))
+            if fresh_set:
+                # Generate unique session
+                user_seed = secrets.token_hex(8)
+                
+                service = get_mind_service()
+                questions = asyncio_runtime.run(service.generate_questions(
+                    num_questions=num_questions,
+                    categories=selected_categories if selected_categories else None,
+                    difficulty=difficulty,
+                    user_seed=user_seed
+                ))
+            else:
+                # Same settings within the hour reuse the stored set without an LLM call
+                from app.services.mind_exercise_service import IncompleteQuestionSet
+                try:
+                    questions = _cached_question_set(num_questions, tuple(sorted(selected_categories)), difficulty)
+                except IncompleteQuestionSet as e:
+                    questions = e.questions
         
         if questions:
             st.session_state.mind_exercise_questions = questions
+            st.session_state.mind_exercise_questions_html = _render_questions(questions)
             st.session_state.mind_exercise_active = True
             st.session_state.current_question_index = 0
             st.session_state.mind_exercise_answers = []
-            st.session_state.question_start_time = datetime.now()
+            st.session_state.question_start_time = time.monotonic()
             st.rerun()
         else:
             st.error("Failed to generate questions. Please try again.")
@@ -168,81 +175,26 @@ def render_mind_exercise_question():
     
     question = questions[current_idx]
     
-    # CSS for question display
-    st.markdown("""
-    <style>
-    .question-header {
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-        margin-bottom: 20px;
-    }
-    .question-progress {
-        color: #667eea;
-        font-weight: 600;
-    }
-    .question-category {
-        background: rgba(99, 102, 241, 0.2);
-        padding: 6px 15px;
-        border-radius: 20px;
-        font-size: 0.9rem;
-        color: #a0aec0;
-    }
-    .question-box {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
-        border: 1px solid rgba(99, 102, 241, 0.3);
-        border-radius: 20px;
-        padding: 30px;
-        margin: 20px 0;
-    }
-    .question-text {
-        font-size: 1.3rem;
-        color: #e2e8f0;
-        line-height: 1.6;
-    }
-    .timer-display {
-        text-align: center;
-        font-size: 1.5rem;
-        color: #f59e0b;
-        margin: 15px 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    # Markup is built once per session when the questions arrive
+    rendered = st.session_state.get('mind_exercise_questions_html')
+    if not rendered or len(rendered) != len(questions):
+        rendered = st.session_state.mind_exercise_questions_html = _render_questions(questions)
+    question_html = rendered[current_idx]
     
     # Header with progress and category
-    st.markdown(f"""
-    <div class="question-header">
-        <span class="question-progress">Question {current_idx + 1} of {len(questions)}</span>
-        <span class="question-category">{question.get('category_icon', '🧠')} {question.get('category_name', 'Logic')}</span>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(question_html["header"], unsafe_allow_html=True)
     
     # Progress bar
     progress = (current_idx) / len(questions)
     st.progress(progress)
     
-    # Timer display (suggested time)
-    time_limit = question.get('time_limit', 30)
-    st.markdown(f"""
-    <div class="timer-display">
-        ⏱️ Suggested time: {time_limit} seconds
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Question box
-    st.markdown(f"""
-    <div class="question-box">
-        <div class="question-text">{question.get('question', 'Question not available')}</div>
-    </div>
-    """, unsafe_allow_html=True)
+    # Timer display (suggested time) and question box
+    st.markdown(question_html["body"], unsafe_allow_html=True)
     
     # Options as radio buttons
-    options = question.get('options', {})
-    option_list = [f"{k}: {v}" for k, v in options.items()]
-    
     selected = st.radio(
         "Select your answer:",
-        options=option_list,
+        options=question_html["options"],
         key=f"answer_{current_idx}",
         label_visibility="collapsed"
     )
@@ -255,8 +207,8 @@ def render_mind_exercise_question():
         if st.button("Submit Answer ✓", use_container_width=True, type="primary"):
             if selected:
                 # Calculate time taken
-                start_time = st.session_state.get('question_start_time', datetime.now())
-                time_taken = (datetime.now() - start_time).total_seconds()
+                now = time.monotonic()
+                time_taken = now - (st.session_state.get('question_start_time') or now)
                 
                 # Extract answer letter
                 answer_letter = selected.split(":")[0].strip()
@@ -270,8 +222,10 @@ def render_mind_exercise_question():
                 })
                 
                 # Move to next question
-                st.session_state.current_question_index += 1
-                st.session_state.question_start_time = datetime.now()
+                st.session_state.update(
+                    current_question_index=current_idx + 1,
+                    question_start_time=now
+                )
                 st.rerun()
             else:
                 st.warning("Please select an answer before submitting.")
@@ -286,43 +240,6 @@ def render_mind_exercise_results():
     service = get_mind_service()
     results = service.calculate_results(questions, answers)
     
-    # CSS
-    st.markdown("""
-    <style>
-    .results-header {
-        text-align: center;
-        margin-bottom: 30px;
-    }
-    .results-title {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        -webkit-background-clip: text;
-        -webkit-text-fill-color: transparent;
-        font-size: 2.5rem;
-        font-weight: 700;
-    }
-    .performance-badge {
-        font-size: 2rem;
-        margin-top: 10px;
-    }
-    .stat-card {
-        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
-        border: 1px solid rgba(99, 102, 241, 0.3);
-        border-radius: 16px;
-        padding: 25px;
-        text-align: center;
-    }
-    .stat-value {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #667eea;
-    }
-    .stat-label {
-        color: #a0aec0;
-        font-size: 0.9rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
-    
     st.markdown(f"""
     <div class="results-header">
         <div class="results-title">🎉 Exercise Complete!</div>
@@ -372,34 +289,43 @@ def render_mind_exercise_results():
     breakdown = results.get('category_breakdown', {})
     
     if breakdown:
+        # One table element rather than a row of widgets per category
+        rows = {"Category": [], "Accuracy": [], "Score": []}
         for cat, scores in breakdown.items():
             cat_info = service.CATEGORIES.get(cat, {'icon': '📝', 'name': cat})
             correct = scores['correct']
             total = scores['total']
-            pct = (correct / total * 100) if total > 0 else 0
-            
-            col1, col2 = st.columns([1, 4])
-            with col1:
-                st.markdown(f"**{cat_info['icon']} {cat_info['name']}**")
-            with col2:
-                st.progress(pct / 100)
-                st.caption(f"{correct}/{total} correct ({pct:.0f}%)")
+            rows["Category"].append(f"{cat_info['icon']} {cat_info['name']}")
+            rows["Accuracy"].append((correct / total * 100) if total > 0 else 0)
+            rows["Score"].append(f"{correct}/{total} correct")
+        
+        st.dataframe(
+            rows,
+            column_config={
+                "Accuracy": st.column_config.ProgressColumn(format="%.0f%%", min_value=0, max_value=100)
+            },
+            hide_index=True,
+            use_container_width=True
+        )
     
     st.markdown("<br>", unsafe_allow_html=True)
     
     # Review answers
-    with st.expander("📝 Review All Answers"):
-        for idx, q in enumerate(questions):
-            user_answer = next((a for a in answers if a['question_id'] == q['id']), None)
-            if user_answer:
-                is_correct = user_answer['correct']
-                icon = "✅" if is_correct else "❌"
+    # An expander body runs even while collapsed, so the review is built only on request
+    if st.toggle("📝 Review All Answers", key="mind_show_review"):
+        with st.container(border=True):
+            answers_by_qid = {a['question_id']: a for a in answers}
+            for idx, q in enumerate(questions):
+                user_answer = answers_by_qid.get(q['id'])
+                if user_answer:
+                    is_correct = user_answer['correct']
+                    icon = "✅" if is_correct else "❌"
                 
-                st.markdown(f"**{icon} Q{idx + 1}: {q['question']}**")
-                st.markdown(f"Your answer: **{user_answer['answer']}** | Correct: **{q['correct_answer']}**")
-                if not is_correct:
-                    st.caption(f"💡 {q['explanation']}")
-                st.markdown("---")
+                    st.markdown(f"**{icon} Q{idx + 1}: {q['question']}**")
+                    st.markdown(f"Your answer: **{user_answer['answer']}** | Correct: **{q['correct_answer']}**")
+                    if not is_correct:
+                        st.caption(f"💡 {q['explanation']}")
+                    st.markdown("---")
     
     st.markdown("<br>", unsafe_allow_html=True)
     
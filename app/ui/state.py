@@ -14,19 +14,25 @@ DEFAULTS = {
     "mode_selected": True,   # Whether user has chosen a mode
     "review_data": None,
     "last_ai_message": "",
+    "last_ai_audio": None,  # MP3 bytes for the current AI message, set when the turn advances
+    "audio_paths": None,  # deque of this session's TTS scratch files, created on first use
     "recorder_key": 0,
     "session_id": None,
     "turn_number": 0,
     "turn_analytics": [],  # List of analytics per turn
     "cv_content": "",  # Parsed CV text for personalized interviews
+    "cv_text": "",  # Raw extracted CV text, shown in the upload preview
+    "cv_file_id": None,  # Upload the CV fields were parsed from, to skip re-parsing
+    "pending_turn": None,  # {turn, future, updates} for an audio turn still being processed
     "ready_to_record": False,  # Whether user is ready to record (after AI finishes speaking)
     # Mind Exercise state
     "show_mind_gym": False,  # Whether to show Mind Gym page
     "mind_exercise_active": False,  # Whether an exercise session is in progress
     "mind_exercise_questions": [],  # Current session questions
+    "mind_exercise_questions_html": [],  # Pre-rendered markup and option labels per question
     "mind_exercise_answers": [],  # User's answers for current session
     "current_question_index": 0,  # Current question being answered
-    "question_start_time": None,  # When current question was started
+    "question_start_time": None,  # time.monotonic() when current question was started
     "show_company_docs": False,  # Whether to show Company Research page
     "processed_files": set(),  # Track uploaded files to prevent duplicates
 }
@@ -34,9 +40,11 @@ DEFAULTS = {
 
 def init_state():
     """Initialize all session state variables with defaults."""
-    for key, default_value in DEFAULTS.items():
-        if key not in st.session_state:
-            st.session_state[key] = default_value
+    # Keys are never deleted, so after the first run one lookup is enough
+    if st.session_state.get("_state_initialized"):
+        return
+    missing = {key: value for key, value in DEFAULTS.items() if key not in st.session_state}
+    st.session_state.update(missing, _state_initialized=True)
 
 def get_state(key: str):
     """Safely get a session state value."""
@@ -50,8 +58,8 @@ def reset_state():
     """Reset interview-related state to defaults."""
     reset_keys = [
         "messages", "interview_active", "interview_mode", "mode_selected",
-        "review_data", "last_ai_message", "turn_number", "turn_analytics",
-        "difficulty_level", "cv_content", "ready_to_record",
+        "review_data", "last_ai_message", "last_ai_audio", "turn_number", "turn_analytics",
+        "difficulty_level", "cv_content", "cv_text", "cv_file_id", "ready_to_record",
         "show_company_docs", "show_mind_gym"  # Clear page navigation flags
     ]
     for key in reset_keys:
@@ -0,0 +1,117 @@
+"""
+Static Stylesheets.
+Page CSS shared across reruns, emitted from the router in streamlit_app.py.
+"""
+
+# Mind Gym welcome, question and results pages
+MIND_GYM_CSS = """
+    <style>
+    .mind-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-size: 2.5rem;
+        font-weight: 700;
+        text-align: center;
+        margin-bottom: 10px;
+    }
+    .mind-subtitle {
+        text-align: center;
+        color: #a0aec0;
+        font-size: 1.1rem;
+        margin-bottom: 30px;
+    }
+    .category-grid {
+        display: grid;
+        grid-template-columns: repeat(5, 1fr);
+        gap: 10px;
+    }
+    .category-card {
+        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
+        border: 1px solid rgba(99, 102, 241, 0.3);
+        border-radius: 16px;
+        padding: 20px;
+        text-align: center;
+        margin: 10px 0;
+    }
+    .category-icon {
+        font-size: 2.5rem;
+        margin-bottom: 10px;
+    }
+    .category-name {
+        font-size: 1.1rem;
+        font-weight: 600;
+        color: #e2e8f0;
+    }
+    .category-desc {
+        font-size: 0.85rem;
+        color: #a0aec0;
+    }
+    .question-header {
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+        margin-bottom: 20px;
+    }
+    .question-progress {
+        color: #667eea;
+        font-weight: 600;
+    }
+    .question-category {
+        background: rgba(99, 102, 241, 0.2);
+        padding: 6px 15px;
+        border-radius: 20px;
+        font-size: 0.9rem;
+        color: #a0aec0;
+    }
+    .question-box {
+        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
+        border: 1px solid rgba(99, 102, 241, 0.3);
+        border-radius: 20px;
+        padding: 30px;
+        margin: 20px 0;
+    }
+    .question-text {
+        font-size: 1.3rem;
+        color: #e2e8f0;
+        line-height: 1.6;
+    }
+    .timer-display {
+        text-align: center;
+        font-size: 1.5rem;
+        color: #f59e0b;
+        margin: 15px 0;
+    }
+    .results-header {
+        text-align: center;
+        margin-bottom: 30px;
+    }
+    .results-title {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        -webkit-background-clip: text;
+        -webkit-text-fill-color: transparent;
+        font-size: 2.5rem;
+        font-weight: 700;
+    }
+    .performance-badge {
+        font-size: 2rem;
+        margin-top: 10px;
+    }
+    .stat-card {
+        background: linear-gradient(135deg, rgba(99, 102, 241, 0.1) 0%, rgba(139, 92, 246, 0.1) 100%);
+        border: 1px solid rgba(99, 102, 241, 0.3);
+        border-radius: 16px;
+        padding: 25px;
+        text-align: center;
+    }
+    .stat-value {
+        font-size: 2.5rem;
+        font-weight: 700;
+        color: #667eea;
+    }
+    .stat-label {
+        color: #a0aec0;
+        font-size: 0.9rem;
+    }
+    </style>
+"""
@@ -4,7 +4,6 @@ This is a thin router that initializes the app and routes to the correct page.
 Supports Technical and HR interview modes, plus Mind Gym cognitive training.
 """
 import streamlit as st
-import asyncio
 
 # Core Initialization
 from app.core.config import InterviewMode
@@ -13,21 +12,29 @@ from app.db.session import init_db
 from app.ui.state import init_state, reset_state, set_interview_mode
 from app.ui.components import render_header, render_sidebar_controls, render_replay_section
 from app.ui.pages.interview_page import render_interview_page, render_welcome_page, render_mode_selection
-from app.ui.pages.dashboard_page import render_dashboard_page
-from app.ui.pages.mind_exercise_page import render_mind_exercise_page
 from app.logic.interview_handler import (
     start_new_interview, 
-    end_interview_and_review, 
     get_replay_audio_files
 )
 
 # --- INITIALIZATION ---
-try:
-    init_db()
-except Exception as e:
-    logger.error(f"Database initialization failed: {e}")
+@st.cache_resource(show_spinner=False)
+def _initialized_db() -> bool:
+    """Create the database schema once per process rather than on every rerun."""
+    try:
+        init_db()
+        return True
+    except Exception as e:
+        logger.error(f"Database initialization failed: {e}")
+        return False
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _cached_audio_files(session_id: int, turn_number: int) -> list:
+    """List replay audio for a session; turn_number refreshes it when a turn adds files."""
+    return get_replay_audio_files(session_id)
 
 st.set_page_config(page_title="AI Interview Coach", page_icon="🎙️", layout="wide")
+_initialized_db()
 init_state()
 
 # --- HEADER ---
@@ -44,8 +51,9 @@ if action == "start":
     reset_state()
     st.rerun()
 elif action == "end":
+    from app.logic.interview_handler import end_interview_and_review
     with st.spinner("Generating your detailed performance review..."):
-        asyncio.run(end_interview_and_review())
+        end_interview_and_review()
     st.rerun()
 elif action and action.startswith("mode_"):
     # User selected a mode
@@ -78,7 +86,7 @@ with st.sidebar:
 
 # --- REPLAY SIDEBAR ---
 if st.session_state.session_id:
-    audio_files = get_replay_audio_files(st.session_state.session_id)
+    audio_files = _cached_audio_files(st.session_state.session_id, st.session_state.turn_number)
     render_replay_section(st.session_state.session_id, audio_files)
 
 # --- PAGE ROUTING ---
@@ -88,9 +96,13 @@ if st.session_state.get("show_company_docs", False):
     render_company_docs_page()
 elif st.session_state.get("show_mind_gym", False):
     # Mind Gym Page
+    from app.ui.pages.mind_exercise_page import render_mind_exercise_page
+    from app.ui.static_css import MIND_GYM_CSS
+    st.markdown(MIND_GYM_CSS, unsafe_allow_html=True)
     render_mind_exercise_page()
 elif st.session_state.review_data:
     # Dashboard Page
+    from app.ui.pages.dashboard_page import render_dashboard_page
     if render_dashboard_page(st.session_state.review_data, st.session_state.get("interview_mode")):
         st.session_state.review_data = None
         st.rerun()